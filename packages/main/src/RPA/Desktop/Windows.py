@@ -1,4 +1,5 @@
-# pylint: disable=c-extension-no-member
+# pylint: disable=c-extension-no-member,too-many-lines
+import importlib
 import json
 import logging
 import os
@@ -16,14 +17,13 @@ from RPA.Desktop.OperatingSystem import OperatingSystem
 from RPA.Images import Images
 from RPA.core.helpers import delay, clean_filename
 
+IS_WINDOWS = platform.system() == "Windows"
 
-if platform.system() == "Windows":
+if IS_WINDOWS:
     import ctypes
     import win32api
-    import win32com.client
     import win32con
     import win32security
-    import pywinauto
     import win32gui
     from comtypes import COMError
 
@@ -41,7 +41,23 @@ def write_element_info_as_json(
     filename = Path(f"{path}/{filename}.json")
     os.makedirs(filename.parent, exist_ok=True)
     with open(filename, "w") as outfile:
-        json.dump(elements, outfile, indent=4, sort_keys=True)
+        outfile.write(json.dumps(elements, indent=4, sort_keys=True))
+
+
+def write_element_info_as_jsonl(
+    elements: list, filename: str, path: str = "output/json"
+) -> None:
+    """Write list of elements into JSON Lines file, one element per line
+
+    :param elements: list of elements to write
+    :param filename: output file name
+    :param path: output directory, defaults to "output/json"
+    """
+    filename = Path(f"{path}/{filename}.jsonl")
+    os.makedirs(filename.parent, exist_ok=True)
+    with open(filename, "w") as outfile:
+        for element in elements:
+            outfile.write(json.dumps(element, sort_keys=True) + "\n")
 
 
 class ElementNotFoundError(Exception):
@@ -57,6 +73,49 @@ class UnknownWindowsBackendError(Exception):
 
 
 SUPPORTED_BACKENDS = ["uia", "win32"]
+INDEXED_CRITERIA = ["name", "class_name", "control_type", "automation_id"]
+LOCATOR_PREFIXES = {
+    "name": "name",
+    "class_name": "class_name",
+    "class": "class_name",
+    "control_type": "control_type",
+    "type": "control_type",
+    "automation_id": "automation_id",
+    "id": "automation_id",
+    "partial name": "partial name",
+    "regexp": "regexp",
+}
+ELEMENT_ATTRIBUTES = [
+    "automation_id",
+    "class_name",
+    "control_id",
+    "control_type",
+    "enabled",
+    "handle",
+    "name",
+    "process_id",
+    "rectangle",
+    "rich_text",
+    "runtime_id",
+    "visible",
+]
+# Element attributes matched as text by locators, the rest keep their native types
+TEXT_ATTRIBUTES = ["automation_id", "class_name", "control_type", "name", "rich_text"]
+# Element attributes read with one UIA cache request, mapped to UIA property names
+UIA_CACHED_PROPERTIES = {
+    "automation_id": "AutomationId",
+    "class_name": "ClassName",
+    "control_type": "ControlType",
+    "enabled": "IsEnabled",
+    "handle": "NativeWindowHandle",
+    "name": "Name",
+    "process_id": "ProcessId",
+    "rectangle": "BoundingRectangle",
+    "visible": "IsOffscreen",
+}
+UIA_LIVE_ATTRIBUTES = [a for a in ELEMENT_ATTRIBUTES if a not in UIA_CACHED_PROPERTIES]
+MISSING = object()
+RECTANGLE_PATTERN = re.compile(r"\(L([-]?\d+).*?T([-]?\d+).*?R([-]?\d+).*?B([-]?\d+)\)")
 
 
 class Windows(OperatingSystem):
@@ -97,6 +156,14 @@ class Windows(OperatingSystem):
     The current method of inspecting elements on Windows is `inspect.exe` which is part
     of `Windows SDK <https://docs.microsoft.com/en-us/windows/win32/winauto/inspect-objects>`_.
 
+    **Element cache**
+
+    Window elements read for locator searches are cached for `element_cache_ttl`
+    seconds (default 2.0), which can be given when importing the library. The cache
+    is cleared on mouse and keyboard actions, when a dialog is minimized or restored,
+    on each `wait_for_element` poll and when `get_element` reads element state.
+    Set the value to 0 to disable caching.
+
     **Keyboard**
 
     The keyword `send_keys` can be used to send keys to the active window. The keyword
@@ -162,7 +229,7 @@ class Windows(OperatingSystem):
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_DOC_FORMAT = "REST"
 
-    def __init__(self, backend: str = "uia") -> None:
+    def __init__(self, backend: str = "uia", element_cache_ttl: float = 2.0) -> None:
         OperatingSystem.__init__(self)
         self._apps = {}
         self._app_instance_id = 0
@@ -173,6 +240,15 @@ class Windows(OperatingSystem):
         self.windowtitle = None
         self.logger = logging.getLogger(__name__)
         self.clipboard = Clipboard()
+        self._desktops = {}
+        self.element_cache_ttl = float(element_cache_ttl)
+        self._element_cache = {}
+        self._element_cache_ts = 0
+        self._output_dir = None
+        self._images_dir = None
+        self._uia_cache_request = None
+        self._keyboard_layout_loaded = False
+        self._pywinauto_module = None
 
     def set_windows_backend(self, backend: str) -> None:
         """Set Windows backend which is used to interact with Windows
@@ -199,6 +275,21 @@ class Windows(OperatingSystem):
                 "Unsupported Windows backend: %s" % backend
             )
 
+    @property
+    def _pywinauto(self) -> Any:
+        """Import `pywinauto` on first use, it is slow to import."""
+        if self._pywinauto_module is None:
+            self._pywinauto_module = importlib.import_module("pywinauto")
+        return self._pywinauto_module
+
+    def _desktop(self) -> Any:
+        """Return desktop root for the current backend, creating it on first use."""
+        if self._backend not in self._desktops:
+            self._desktops[self._backend] = self._pywinauto.Desktop(
+                backend=self._backend
+            )
+        return self._desktops[self._backend]
+
     def _add_app_instance(
         self,
         app: Any = None,
@@ -316,7 +407,8 @@ class Windows(OperatingSystem):
 
         """
         self.logger.info("Open application: %s", application)
-        app = win32com.client.gencache.EnsureDispatch(f"{application}.Application")
+        win32com_client = importlib.import_module("win32com.client")
+        app = win32com_client.gencache.EnsureDispatch(f"{application}.Application")
         app.Visible = True
         # show eg. file overwrite warning or not
         if hasattr(self.app, "DisplayAlerts"):
@@ -342,7 +434,7 @@ class Windows(OperatingSystem):
 
         """
         self.logger.info("Open file: %s", filename)
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # pylint: disable=no-member
             os.startfile(filename)
             return True
@@ -388,7 +480,7 @@ class Windows(OperatingSystem):
             "startkeyword": "Open Executable",
         }
         self.windowtitle = windowtitle
-        app = pywinauto.Application(backend=self._backend).start(
+        app = self._pywinauto.Application(backend=self._backend).start(
             cmd_line=executable, work_dir=work_dir
         )
 
@@ -412,6 +504,7 @@ class Windows(OperatingSystem):
             ${app1}    Open Using Run Dialog  notepad  Untitled - Notepad
 
         """
+        self.invalidate_dialog_cache()
         self.send_keys("{VK_LWIN down}r{VK_LWIN up}")
         delay(1)
 
@@ -442,6 +535,7 @@ class Windows(OperatingSystem):
 
         """
         self.logger.info("Run from start menu: %s", executable)
+        self.invalidate_dialog_cache()
         self.send_keys("{LWIN}")
         delay(1)
 
@@ -497,8 +591,9 @@ class Windows(OperatingSystem):
 
         """
         # Set keyboard layout for Windows platform
-        if platform.system() == "Windows":
+        if IS_WINDOWS and not self._keyboard_layout_loaded:
             win32api.LoadKeyboardLayout("00000409", 1)
+            self._keyboard_layout_loaded = True
 
         self.send_keys(keys_to_type)
         delay(send_delay)
@@ -526,7 +621,8 @@ class Windows(OperatingSystem):
             windowtitle or self._apps[self._active_app_instance]["windowtitle"]
         )
         self.logger.info("Minimize dialog: %s", windowtitle)
-        self.dlg = pywinauto.Desktop(backend=self._backend)[windowtitle]
+        self._invalidate_element_cache()
+        self.dlg = self._desktop()[windowtitle]
         self.dlg.minimize()
 
     def restore_dialog(self, windowtitle: str = None) -> None:
@@ -551,14 +647,15 @@ class Windows(OperatingSystem):
             windowtitle or self._apps[self._active_app_instance]["windowtitle"]
         )
         self.logger.info("Restore dialog: %s", windowtitle)
-        app = pywinauto.Application().connect(title_re=".*%s" % windowtitle)
+        self._invalidate_element_cache()
+        app = self._pywinauto.Application().connect(title_re=".*%s" % windowtitle)
         try:
             app.window().restore()
-        except pywinauto.findwindows.ElementAmbiguousError as e:
+        except self._pywinauto.findwindows.ElementAmbiguousError as e:
             self.logger.info("Could not restore dialog, %s", str(e))
         finally:
             if "handle" in self._apps[self._active_app_instance]:
-                app = pywinauto.Application().connect(
+                app = self._pywinauto.Application().connect(
                     handle=self._apps[self._active_app_instance]["handle"]
                 )
                 app.window().restore()
@@ -589,6 +686,16 @@ class Windows(OperatingSystem):
         if windowtitle:
             self.windowtitle = windowtitle
 
+        active_app = self._apps.get(self._active_app_instance, {})
+        if (
+            not highlight
+            and active_app.get("dlg") is not None
+            and active_app.get("dlg_title") == self.windowtitle
+            and active_app["dlg"].exists(timeout=0)
+        ):
+            self.dlg = active_app["dlg"]
+            return self._active_app_instance
+
         app_instance = None
         end_time = time.time() + float(timeout)
         while time.time() < end_time and app_instance is None:
@@ -646,7 +753,7 @@ class Windows(OperatingSystem):
         """
         self.logger.info("Connect to application handle: %s", handle)
         app_instance = None
-        app = pywinauto.Application(backend=self._backend).connect(
+        app = self._pywinauto.Application(backend=self._backend).connect(
             handle=handle, visible_only=False
         )
         self.dlg = app.window(handle=handle)
@@ -656,11 +763,49 @@ class Windows(OperatingSystem):
             if windowtitle is not None:
                 params = {"windowtitle": windowtitle}
             app_instance = self._add_app_instance(app=app, params=params, dialog=False)
+        if self._active_app_instance in self._apps:
+            self._apps[self._active_app_instance].update(
+                dlg=self.dlg, dlg_title=windowtitle or self.windowtitle
+            )
         return app_instance
 
+    def _is_dialog_current(self) -> bool:
+        active_app = self._apps.get(self._active_app_instance, {})
+        return (
+            self.dlg is not None
+            and self.dlg is active_app.get("dlg")
+            and active_app.get("dlg_title") == self.windowtitle
+            and self.dlg.exists(timeout=1)
+        )
+
+    def invalidate_dialog_cache(self, app_id: int = None) -> None:
+        """Forget the dialog cached for an application, so that the next
+        `open_dialog` resolves the window again by its title.
+
+        Should be called when the application opens a new window with
+        the same title or the cached window has been closed. The last
+        dialog is still kept for `drag_and_drop` until it is resolved again.
+
+        :param app_id: application id, defaults to active application
+
+        Example:
+
+        .. code-block:: robotframework
+
+            ${app1}    Open Executable   calc.exe  Calculator
+            Invalidate Dialog Cache   ${app1}
+
+        """
+        app_id = self._active_app_instance if app_id is None else app_id
+        if app_id in self._apps:
+            self._apps[app_id].pop("dlg_title", None)
+
     def close_all_applications(self) -> None:
         """Close all applications
 
+        :raises RuntimeError: if some applications failed to quit, after
+         trying to quit all of them
+
         Example:
 
         .. code-block:: robotframework
@@ -673,9 +818,18 @@ class Windows(OperatingSystem):
         """
         self.logger.info("Closing all applications")
         self.logger.debug("Applications in memory: %d", len(self._apps))
-        for aid in list(self._apps):
-            self.quit_application(aid)
-            del self._apps[aid]
+        errors = []
+        for app_id in list(self._apps):
+            app = self._apps.pop(app_id)
+            self.logger.info("Quit application: %s (%s)", app_id, app)
+            try:
+                self._quit_app(app)
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(f"{app_id}: {err}")
+        self._active_app_instance = -1
+        self._desktops = {}
+        if errors:
+            raise RuntimeError("Failed to quit applications: " + ", ".join(errors))
 
     def quit_application(self, app_id: str = None, send_keys: bool = False) -> None:
         """Quit an application by application id or
@@ -698,16 +852,18 @@ class Windows(OperatingSystem):
             self.switch_to_application(app_id)
             self.send_keys("%{F4}")
         else:
-            if app["dispatched"]:
-                app["app"].Quit()
-            else:
-                if "process" in app and app["process"] > 0:
-                    # pylint: disable=E1101
-                    self.kill_process_by_pid(app["process"])
-                else:
-                    app["app"].kill()
+            self._quit_app(app)
         self._active_app_instance = -1
 
+    def _quit_app(self, app: dict) -> None:
+        if app["dispatched"]:
+            app["app"].Quit()
+        elif "process" in app and app["process"] > 0:
+            # pylint: disable=E1101
+            self.kill_process_by_pid(app["process"])
+        else:
+            app["app"].kill()
+
     def type_keys(self, keys: str) -> None:
         """Type keys into active window element.
 
@@ -723,6 +879,7 @@ class Windows(OperatingSystem):
         """
         if self.dlg is None:
             raise ValueError("No dialog open")
+        self._invalidate_element_cache()
         self.dlg.type_keys(keys)
 
     def type_into(self, locator: str, keys: str, empty_field: bool = False) -> None:
@@ -740,9 +897,10 @@ class Windows(OperatingSystem):
             Type Into        CalculatorResults  22  empty_field=True
 
         """
-        elements, _ = self.find_element(locator)
+        elements, _ = self._match_elements(locator)
         if elements and len(elements) == 1:
             ctrl = elements[0]["control"]
+            self._invalidate_element_cache()
             if empty_field:
                 ctrl.type_keys("{VK_LBUTTON down}{VK_CLEAR}{VK_LBUTTON up}")
             ctrl.type_keys(keys)
@@ -762,7 +920,8 @@ class Windows(OperatingSystem):
             Send Keys        2{+}3=
 
         """
-        pywinauto.keyboard.send_keys(keys)
+        self._invalidate_element_cache()
+        self._pywinauto.keyboard.send_keys(keys)
 
     def get_text(self, locator: str) -> dict:
         """Get text from element
@@ -779,7 +938,7 @@ class Windows(OperatingSystem):
             &{val}       Get Text   CalculatorResults
 
         """
-        elements, _ = self.find_element(locator)
+        elements, _ = self._match_elements(locator)
         element_text = {}
         if elements and len(elements) == 1:
             ctrl = elements[0]["control"]
@@ -856,7 +1015,7 @@ class Windows(OperatingSystem):
             if isinstance(locator, dict):
                 target_element = locator
             else:
-                element, _ = self.find_element(locator)
+                element, _ = self._match_elements(locator)
                 if element and len(element) == 1:
                     target_element = element[0]
                 else:
@@ -870,6 +1029,40 @@ class Windows(OperatingSystem):
         elif method == "image":
             self.mouse_click_image(image, off_x, off_y, ctype, **kwargs)
 
+    def mouse_click_many(
+        self, locators: list, ctype: str = "click", off_x: int = 0, off_y: int = 0
+    ) -> None:
+        """Mouse click elements matched by given locators in order.
+
+        All locators are resolved from one snapshot of the window elements
+        before any clicks are made, so locators can't refer to elements
+        which appear only after an earlier click.
+
+        :param locators: list of element locators on active window
+        :param ctype: type of mouse click
+        :param off_x: offset x for each click
+        :param off_y: offset y for each click
+        :raises ValueError: if any locator does not match unique element
+
+        Example:
+
+        .. code-block:: robotframework
+
+            Open Executable   calc.exe  Calculator
+            @{buttons}=       Create List   One  Plus  Two  Equals
+            Mouse Click Many  ${buttons}
+
+        """
+        self.logger.info("Mouse click many: %s", locators)
+        coordinates = []
+        for locator in locators:
+            elements, _ = self._match_elements(locator)
+            if len(elements) != 1:
+                raise ValueError(f"Could not find unique element for '{locator}'")
+            coordinates.append(self.get_element_center(elements[0]))
+        for x, y in coordinates:
+            self.click_type(x + off_x, y + off_y, ctype)
+
     def mouse_click_image(
         self,
         template: str,
@@ -946,17 +1139,15 @@ class Windows(OperatingSystem):
 
         """
         self.logger.info("Get element: %s", locator)
-        if open_dialog:
+        self._invalidate_element_cache()
+        if not open_dialog:
+            self.dlg.wait("exists enabled visible ready")
+        elif not self._is_dialog_current():
             self.open_dialog(self.windowtitle)
-        self.dlg.wait("exists enabled visible ready")
+            self.dlg.wait("exists enabled visible ready")
 
         search_criteria, locator = self._determine_search_criteria(locator)
-        matching_elements, locators = self.find_element(locator, search_criteria)
-
-        locators = sorted(set(locators))
-        if locator in locators:
-            locators.remove(locator)
-        locators_string = "\n\t- ".join(locators)
+        matching_elements, locators = self._match_elements(locator, search_criteria)
 
         if len(matching_elements) == 0:
             self.logger.info(
@@ -965,7 +1156,7 @@ class Windows(OperatingSystem):
                 locator,
                 search_criteria,
                 self.windowtitle,
-                locators_string,
+                self._format_locator_suggestions(locators, locator),
             )
         elif len(matching_elements) == 1:
             element = matching_elements[0]
@@ -982,10 +1173,14 @@ class Windows(OperatingSystem):
                 "Maybe one of these would be better?\n%s\n",
                 locator,
                 self.windowtitle,
-                locators_string,
+                self._format_locator_suggestions(locators, locator),
             )
         return False
 
+    def _format_locator_suggestions(self, locators: list, locator: str) -> str:
+        suggestions = {loc for loc in locators if loc is not None and loc != locator}
+        return "\n\t- ".join(sorted(suggestions))
+
     def get_element_rich_text(self, locator: str) -> Any:
         """Get value of element `rich text` attribute.
 
@@ -1095,6 +1290,7 @@ class Windows(OperatingSystem):
         self.logger.info("Menu select: %s", menuitem)
         if self.dlg is None:
             raise ValueError("No dialog open")
+        self._invalidate_element_cache()
         try:
             self.dlg.menu_select(menuitem)
         except AttributeError as e:
@@ -1133,7 +1329,8 @@ class Windows(OperatingSystem):
         interval = max([0.5, interval])
         elements = None
         while time.time() < end_time:
-            elements, _ = self.find_element(locator, search_criteria)
+            self._invalidate_element_cache()
+            elements, _ = self._match_elements(locator, search_criteria)
             if len(elements) > 1:
                 break
             if interval >= timeout:
@@ -1149,11 +1346,16 @@ class Windows(OperatingSystem):
             return elements
         raise ElementNotFoundError
 
-    def find_element(self, locator: str, search_criteria: str = None) -> Any:
+    def find_element(
+        self, locator: str, search_criteria: str = None, first_only: bool = False
+    ) -> Any:
         """Find element from window by locator and criteria.
 
         :param locator: name of the locator
         :param search_criteria: criteria by which element is matched
+        :param first_only: stop at the first matching element if True,
+         defaults to False. Locators are then listed only up to that element
+         for criteria which are not indexed (`partial name`, `regexp`)
         :return: list of matching elements and locators that were found on the window
 
         Example:
@@ -1163,13 +1365,31 @@ class Windows(OperatingSystem):
             @{elements}   Find Element   CalculatorResults
             Log Many  ${elements[0]}     # list of matching elements
             Log Many  ${elements[1]}     # list of all available locators
+            @{elements}   Find Element   partial name:Display   first_only=True
+
+        """
+        matching_elements, locators = self._match_elements(
+            locator, search_criteria, first_only
+        )
+        if isinstance(locators, dict):
+            locators = [value for value, indexes in locators.items() for _ in indexes]
+        return matching_elements, locators
+
+    def _match_elements(
+        self, locator: str, search_criteria: str = None, first_only: bool = False
+    ) -> Any:
+        """Match elements like `find_element`, but for indexed criteria return
+        the index of locator values instead of listing every locator.
 
+        :return: list of matching elements and locators, or their index
         """
         search_locator = locator
         if search_criteria is None:
             search_criteria, search_locator = self._determine_search_criteria(locator)
 
-        controls, elements = self.get_window_elements()
+        self._enumerate_window_elements()
+        controls = self._element_cache["controls"]
+        elements = self._element_cache["elements"]
         self.logger.info(
             "Find element: (locator: %s, criteria: %s)",
             locator,
@@ -1177,14 +1397,29 @@ class Windows(OperatingSystem):
         )
 
         matching_elements, locators = [], []
+        if search_criteria == "any" or search_criteria in INDEXED_CRITERIA:
+            index = self._element_cache["index"]
+            if search_criteria == "any":
+                hits = [values.get(search_locator, []) for values in index.values()]
+                matches = sorted(set().union(*hits))
+                locator_values = index["name"]
+            else:
+                matches = index[search_criteria].get(search_locator, [])
+                locator_values = index[search_criteria]
+            if first_only:
+                matches = matches[:1]
+            matching_elements = [
+                {**elements[idx], "control": controls[idx]} for idx in matches
+            ]
+            return matching_elements, locator_values
+
         for ctrl, element in zip(controls, elements):
-            if self.is_element_matching(element, search_locator, search_criteria):
-                element["control"] = ctrl
-                matching_elements.append(element)
-            if search_criteria == "any" and "name" in element:
-                locators.append(element["name"])
-            elif search_criteria and search_criteria in element:
+            if search_criteria and search_criteria in element:
                 locators.append(element[search_criteria])
+            if self.is_element_matching(element, search_locator, search_criteria):
+                matching_elements.append({**element, "control": ctrl})
+                if first_only:
+                    break
 
         return matching_elements, locators
 
@@ -1202,28 +1437,10 @@ class Windows(OperatingSystem):
         :param locator: name of the locator
         :return: criteria and locator
         """
-        if locator.startswith("name:"):
-            search_criteria = "name"
-            _, locator = locator.split(":", 1)
-        elif locator.startswith(("class_name:", "class:")):
-            search_criteria = "class_name"
-            _, locator = locator.split(":", 1)
-        elif locator.startswith(("control_type:", "type:")):
-            search_criteria = "control_type"
-            _, locator = locator.split(":", 1)
-        elif locator.startswith(("automation_id:", "id:")):
-            search_criteria = "automation_id"
-            _, locator = locator.split(":", 1)
-        elif locator.startswith("partial name:"):
-            search_criteria = "partial name"
-            _, locator = locator.split(":", 1)
-        elif locator.startswith("regexp:"):
-            search_criteria = "regexp"
-            _, locator = locator.split(":", 1)
-        else:
-            search_criteria = "any"
-
-        return search_criteria, locator
+        prefix, separator, value = locator.partition(":")
+        if separator and prefix in LOCATOR_PREFIXES:
+            return LOCATOR_PREFIXES[prefix], value
+        return "any", locator
 
     # TODO: supporting multiple search criterias at same time to identify ONE element
     def _is_element_matching(
@@ -1235,20 +1452,13 @@ class Windows(OperatingSystem):
             type_search = re.search(locator, itemdict["control_type"])
             id_search = re.search(locator, itemdict["automation_id"])
             return name_search or class_search or type_search or id_search
-        elif criteria != "any" and criteria in itemdict:
-            if (wildcard and locator in itemdict[criteria]) or (
-                locator == itemdict[criteria]
-            ):
-                return True
         elif criteria == "any":
-            name_search = self.is_element_matching(itemdict, locator, "name")
-            class_search = self.is_element_matching(itemdict, locator, "class_name")
-            type_search = self.is_element_matching(itemdict, locator, "control_type")
-            id_search = self.is_element_matching(itemdict, locator, "automation_id")
-            if name_search or class_search or type_search or id_search:
-                return True
+            return any(itemdict.get(key) == locator for key in INDEXED_CRITERIA)
         elif criteria == "partial name":
-            return self.is_element_matching(itemdict, locator, "name", True)
+            return "name" in itemdict and locator in itemdict["name"]
+        elif criteria in itemdict:
+            value = str(itemdict[criteria])
+            return locator == value or (wildcard and locator in value)
         return False
 
     # TODO: supporting multiple search criterias at same time to identify ONE element
@@ -1313,7 +1523,11 @@ class Windows(OperatingSystem):
             ${x}  ${y}=  Get Element Center  ${elements[0][0]}
 
         """
-        return self.calculate_rectangle_center(element["rectangle"])
+        rectangle = element["rectangle"]
+        if isinstance(rectangle, tuple):
+            left, top, right, bottom = rectangle
+            return (left + right) // 2, (top + bottom) // 2
+        return self.calculate_rectangle_center(rectangle)
 
     def click_type(
         self, x: int = None, y: int = None, click_type: str = "click"
@@ -1339,26 +1553,31 @@ class Windows(OperatingSystem):
         self.logger.info("Click type '%s' at (%s, %s)", click_type, x, y)
         if (x is None and y is None) or (x < 0 or y < 0):
             raise ValueError(f"Can't click on given coordinates: ({x}, {y})")
+        self._invalidate_element_cache()
         if click_type == "click":
-            pywinauto.mouse.click(coords=(x, y))
+            self._pywinauto.mouse.click(coords=(x, y))
         elif click_type == "double":
-            pywinauto.mouse.double_click(coords=(x, y))
+            self._pywinauto.mouse.double_click(coords=(x, y))
         elif click_type == "right":
-            pywinauto.mouse.right_click(coords=(x, y))
+            self._pywinauto.mouse.right_click(coords=(x, y))
 
     def get_window_elements(
         self,
         screenshot: bool = False,
         element_json: bool = False,
         outline: bool = False,
+        element_jsonl: bool = False,
     ) -> Any:
         # pylint: disable=C0301
         """Get element information about all window dialog controls
         and their descendants.
 
         :param screenshot: save element screenshot if True, defaults to False
-        :param element_json: save element json if True, defaults to False
+        :param element_json: save all elements into one json file if True,
+         defaults to False
         :param outline: highlight elements if True, defaults to False
+        :param element_jsonl: save elements into json lines file, one element
+         per line, if True, defaults to False
         :return: all controls and all elements
 
         Example:
@@ -1371,42 +1590,98 @@ class Windows(OperatingSystem):
             @{elements}   Get Window Elements  screenshot=True  element_json=True  outline=True
 
         """  # noqa: E501
+        controls, elements = self._enumerate_window_elements(
+            use_cache=not (screenshot or element_json or outline or element_jsonl)
+        )
+        controls, elements = list(controls), [dict(element) for element in elements]
+
+        if screenshot or outline:
+            for ctrl, element in zip(controls, elements):
+                if screenshot and element.get("name"):
+                    filename = clean_filename(
+                        f"locator_{self.windowtitle}_ctrl_{element['name']}"
+                    )
+                    self.screenshot(filename, ctrl=ctrl, overwrite=True)
+                if outline:
+                    ctrl.draw_outline(colour="red", thickness=4)
+                    delay(0.2)
+                    ctrl.draw_outline(colour=0x000000, thickness=4)
+
+        all_elements_filename = clean_filename(
+            f"locator_{self.windowtitle}_all_elements"
+        )
+        if element_json:
+            write_element_info_as_json(elements, all_elements_filename)
+        if element_jsonl:
+            write_element_info_as_jsonl(elements, all_elements_filename)
+
+        return controls, elements
+
+    def _enumerate_window_elements(self, use_cache: bool = True) -> Any:
+        """Parse attributes of the dialog and its descendants, and index them.
+
+        :param use_cache: return the cached snapshot if it is still valid
+        :return: all controls and all elements of the snapshot, not copied
+        """
         if self.dlg is None:
             raise ValueError("No dialog open")
 
-        ctrls = [self.dlg]
+        if use_cache and self._is_element_cache_valid():
+            return self._element_cache["controls"], self._element_cache["elements"]
+
+        controls = [self.dlg]
         if hasattr(self.dlg, "descendants"):
-            ctrls += self.dlg.descendants()
+            controls += self.dlg.descendants()
 
-        elements, controls = [], []
-        for _, ctrl in enumerate(ctrls):
-            if not hasattr(ctrl, "element_info"):
-                continue
+        elements = []
+        index = {criteria: {} for criteria in INDEXED_CRITERIA}
+        for position, ctrl in enumerate(controls):
+            element = self._parse_element_attributes(element=ctrl)
+            self._add_to_element_index(index, element, position)
+            elements.append(element)
 
-            filename = clean_filename(
-                f"locator_{self.windowtitle}_ctrl_{ctrl.element_info.name}"
-            )
+        self._element_cache = {
+            "dlg": self.dlg,
+            "controls": controls,
+            "elements": elements,
+            "index": index,
+        }
+        self._element_cache_ts = time.monotonic()
+        return controls, elements
 
-            if screenshot and len(ctrl.element_info.name) > 0:
-                self.screenshot(filename, ctrl=ctrl, overwrite=True)
-            if outline:
-                ctrl.draw_outline(colour="red", thickness=4)
-                delay(0.2)
-                ctrl.draw_outline(colour=0x000000, thickness=4)
+    def _add_to_element_index(self, index: dict, element: dict, position: int) -> None:
+        for criteria, values in index.items():
+            if criteria in element:
+                values.setdefault(element[criteria], []).append(position)
 
-            element = self._parse_element_attributes(element=ctrl)
-            if element_json:
-                write_element_info_as_json(element, filename)
+    def refresh_window_elements(self) -> Any:
+        """Discard cached window elements and read them again from the
+        active dialog.
 
-            controls.append(ctrl)
-            elements.append(element)
+        Use this keyword when the window has changed by other means than
+        the library keywords, see **Element cache** in library documentation.
 
-        if element_json:
-            write_element_info_as_json(
-                elements, clean_filename(f"locator_{self.windowtitle}_all_elements")
-            )
+        :return: all controls and all elements
 
-        return controls, elements
+        Example:
+
+        .. code-block:: robotframework
+
+            @{elements}   Refresh Window Elements
+
+        """
+        self._invalidate_element_cache()
+        return self.get_window_elements()
+
+    def _is_element_cache_valid(self) -> bool:
+        return (
+            self._element_cache.get("dlg") is self.dlg
+            and time.monotonic() - self._element_cache_ts < self.element_cache_ttl
+        )
+
+    def _invalidate_element_cache(self) -> None:
+        self._element_cache = {}
+        self._element_cache_ts = 0
 
     def _get_element_coordinates(self, rectangle: Any) -> Any:
         """Get element coordinates from pywinauto object.
@@ -1423,23 +1698,21 @@ class Windows(OperatingSystem):
         top = 0
         right = 0
         bottom = 0
-        if isinstance(rectangle, pywinauto.win32structures.RECT):
-            left = rectangle.left
-            top = rectangle.top
-            right = rectangle.right
-            bottom = rectangle.bottom
+        if isinstance(rectangle, (tuple, list)):
+            left, top, right, bottom = rectangle
         elif isinstance(rectangle, dict):
+            left = rectangle["left"]
+            top = rectangle["top"]
+            right = rectangle["right"]
+            bottom = rectangle["bottom"]
+        elif isinstance(rectangle, self._pywinauto.win32structures.RECT):
             left = rectangle.left
             top = rectangle.top
             right = rectangle.right
             bottom = rectangle.bottom
         else:
             left, top, right, bottom = map(
-                int,
-                re.match(
-                    r"\(L([-]?\d+).*T([-]?\d+).*R([-]?\d+).*B([-]?\d+)\)",
-                    str(rectangle),
-                ).groups(),
+                int, RECTANGLE_PATTERN.match(str(rectangle)).groups()
             )
         return left, top, right, bottom
 
@@ -1485,17 +1758,25 @@ class Windows(OperatingSystem):
                     "Unable to take screenshot, because regions was: %s", region
                 )
                 return
-        try:
-            output_dir = BuiltIn().get_variable_value("${OUTPUT_DIR}")
-        except (ModuleNotFoundError, RobotNotRunningError):
-            output_dir = Path.cwd()
+        if self._images_dir is None:
+            self._images_dir = self._get_output_dir() / "images"
+            self._images_dir.mkdir(parents=True, exist_ok=True)
 
-        filename = Path(output_dir, "images", clean_filename(filename))
-        os.makedirs(filename.parent, exist_ok=overwrite)
+        filename = (self._images_dir / clean_filename(filename)).with_suffix(".png")
+        if not overwrite and filename.exists():
+            raise FileExistsError(f"Screenshot file '{filename}' already exists")
         Images().take_screenshot(filename=filename, region=region)
 
         self.logger.info("Saved screenshot as '%s'", filename)
 
+    def _get_output_dir(self) -> Path:
+        if self._output_dir is None:
+            try:
+                self._output_dir = Path(BuiltIn().get_variable_value("${OUTPUT_DIR}"))
+            except (ModuleNotFoundError, RobotNotRunningError):
+                self._output_dir = Path.cwd()
+        return self._output_dir
+
     def _parse_element_attributes(self, element: dict) -> dict:
         """Return filtered element dictionary for an element.
 
@@ -1508,52 +1789,78 @@ class Windows(OperatingSystem):
             )
             return None
 
-        attributes_to_remove = [
-            # "automation_id",
-            "children",
-            # "class_name",
-            # "control_id",
-            # "control_type",
-            "descendants",
-            "dump_window",
-            "element",
-            # "enabled",
-            "filter_with_depth",
-            "framework_id",
-            "from_point",
-            # "handle",
-            "has_depth",
-            "iter_children",
-            "iter_descendants",
-            # "name",
-            "parent",
-            # "process_id",
-            # "rectangle",
-            # "rich_text",
-            # "runtime_id",
-            "set_cache_strategy",
-            "top_from_point",
-            # "visible",
-        ]
-
-        element_dict = {}
         element_info = element.element_info
-        element_attributes = [a for a in dir(element_info) if not a.startswith("_")]
+        element_dict = self._get_cached_uia_attributes(element_info)
+        attributes = UIA_LIVE_ATTRIBUTES if element_dict else ELEMENT_ATTRIBUTES
+        element_dict.update(self._get_live_attributes(element_info, attributes))
+        return element_dict
 
-        for attr in element_attributes:
+    def _get_live_attributes(self, element_info: Any, attributes: list) -> dict:
+        element_dict = {}
+        for attr in attributes:
             try:
-                attr_value = getattr(element_info, attr)
-                element_dict[attr] = (
-                    attr_value() if callable(attr_value) else str(attr_value)
-                )
+                attr_value = getattr(element_info, attr, MISSING)
+                if attr_value is MISSING:
+                    continue
+                if attr == "rectangle":
+                    element_dict[attr] = (
+                        attr_value.left,
+                        attr_value.top,
+                        attr_value.right,
+                        attr_value.bottom,
+                    )
+                elif callable(attr_value):
+                    element_dict[attr] = attr_value()
+                elif attr in TEXT_ATTRIBUTES:
+                    element_dict[attr] = str(attr_value)
+                else:
+                    element_dict[attr] = attr_value
             except TypeError:
                 pass
             except COMError as ce:
                 self.logger.info("Got COM error: %s", str(ce))
+        return element_dict
 
-        for attr in attributes_to_remove:
-            element_dict.pop(attr, None)
+    def _get_cached_uia_attributes(self, element_info: Any) -> dict:
+        """Read UIA element attributes with one cache request instead of
+        a COM call per attribute.
 
+        :param element_info: element info of the element
+        :return: dictionary of attributes, empty if not read from the cache
+        """
+        if not isinstance(
+            element_info, self._pywinauto.uia_element_info.UIAElementInfo
+        ):
+            return {}
+        iuia = self._pywinauto.uia_defines.IUIA()
+        if self._uia_cache_request is None:
+            cache_request = iuia.iuia.CreateCacheRequest()
+            for prop in UIA_CACHED_PROPERTIES.values():
+                cache_request.AddProperty(
+                    getattr(iuia.UIA_dll, f"UIA_{prop}PropertyId")
+                )
+            self._uia_cache_request = cache_request
+
+        try:
+            cached = element_info.element.BuildUpdatedCache(self._uia_cache_request)
+        except COMError as ce:
+            self.logger.debug("Could not read cached properties: %s", str(ce))
+            return {}
+        rect = cached.CachedBoundingRectangle
+        element_dict = {
+            "automation_id": cached.CachedAutomationId,
+            "class_name": cached.CachedClassName,
+            "control_type": iuia.known_control_type_ids.get(cached.CachedControlType),
+            "enabled": bool(cached.CachedIsEnabled),
+            "handle": cached.CachedNativeWindowHandle,
+            "name": cached.CachedName,
+            "process_id": cached.CachedProcessId,
+            "rectangle": (rect.left, rect.top, rect.right, rect.bottom),
+            "visible": not cached.CachedIsOffscreen,
+        }
+        for attr in TEXT_ATTRIBUTES:
+            if attr in element_dict:
+                element_dict[attr] = str(element_dict[attr])
         return element_dict
 
     def put_system_to_sleep(self) -> None:
@@ -1615,7 +1922,7 @@ class Windows(OperatingSystem):
         target_x = target_y = 0
         if target_locator is not None:
             self.switch_to_application(target["id"])
-            target_elements, _ = self.find_element(target_locator)
+            target_elements, _ = self._match_elements(target_locator)
             if len(target_elements) == 0:
                 raise ValueError(
                     ("Target element was not found by locator '%s'", target_locator)
@@ -1640,7 +1947,7 @@ class Windows(OperatingSystem):
 
     def _select_elements_for_drag(self, src: dict, src_locator: str) -> Any:
         self.switch_to_application(src["id"])
-        source_elements, _ = self.find_element(src_locator)
+        source_elements, _ = self._match_elements(src_locator)
         if len(source_elements) == 0:
             raise ValueError(
                 ("Source elements where not found by locator '%s'", src_locator)
@@ -1660,11 +1967,9 @@ class Windows(OperatingSystem):
                 source_min_top = top
             if bottom > source_max_bottom:
                 source_max_bottom = bottom
-            mid_x = int((right - left) / 2) + left
-            mid_y = int((bottom - top) / 2) + top
-            selections.append((mid_x, mid_y))
-        source_x = int((source_max_right - source_min_left) / 2) + source_min_left
-        source_y = int((source_max_bottom - source_min_top) / 2) + source_min_top
+            selections.append(((left + right) // 2, (top + bottom) // 2))
+        source_x = (source_min_left + source_max_right) // 2
+        source_y = (source_min_top + source_max_bottom) // 2
         return selections, source_x, source_y
 
     def drag_and_drop(
@@ -1737,16 +2042,16 @@ class Windows(OperatingSystem):
                 self.mouse_click_coords(selection[0] + 5, selection[1] + 5)
 
             # Start drag from the last item
-            pywinauto.mouse.press(coords=(source_x, source_y))
+            self._pywinauto.mouse.press(coords=(source_x, source_y))
             delay(0.5)
             if not single_application:
                 self.restore_dialog(target["windowtitle"])
-            pywinauto.mouse.move(coords=(target_x, target_y))
+            self._pywinauto.mouse.move(coords=(target_x, target_y))
 
             self.logger.debug("Cursor position: %s", win32api.GetCursorPos())
             delay(drop_delay)
             self.mouse_click_coords(target_x, target_y)
-            pywinauto.mouse.click(coords=(target_x, target_y))
+            self._pywinauto.mouse.click(coords=(target_x, target_y))
 
             # if action_required:
             self.send_keys("{ENTER}")
@@ -1775,9 +2080,7 @@ class Windows(OperatingSystem):
             ${x}  ${y}=     Calculate Rectangle Center   ${rect}
         """
         left, top, right, bottom = self._get_element_coordinates(rectangle)
-        x = int((right - left) / 2) + left
-        y = int((bottom - top) / 2) + top
-        return x, y
+        return (left + right) // 2, (top + bottom) // 2
 
     def get_window_list(self):
         """Get list of open windows
@@ -1804,7 +2107,7 @@ class Windows(OperatingSystem):
                 Log Many  ${window}
             END
         """
-        windows = pywinauto.Desktop(backend=self._backend).windows()
+        windows = self._desktop().windows()
         window_list = []
         for w in windows:
             try:
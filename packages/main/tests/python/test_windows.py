@@ -0,0 +1,236 @@
+import json
+from types import SimpleNamespace
+
+import mock
+import pytest
+
+from RPA.Desktop.Windows import (
+    Windows,
+    write_element_info_as_json,
+    write_element_info_as_jsonl,
+)
+
+
+class FakeRect:
+    def __init__(self, left, top, right, bottom):
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+
+
+class FakeUIAElementInfo:
+    pass
+
+
+def fake_control(name, automation_id="", class_name="Button", rectangle=None):
+    element_info = SimpleNamespace(
+        name=name,
+        automation_id=automation_id,
+        class_name=class_name,
+        control_type="Button",
+        enabled=True,
+        visible=True,
+        process_id=12,
+        rectangle=FakeRect(*(rectangle or (0, 0, 10, 10))),
+    )
+    return SimpleNamespace(element_info=element_info)
+
+
+class FakeDialog:
+    def __init__(self, controls):
+        self.element_info = fake_control("Calculator", class_name="Window").element_info
+        self.controls = controls
+        self.reads = 0
+
+    def descendants(self):
+        self.reads += 1
+        return list(self.controls)
+
+    def exists(self, timeout=None):
+        return True
+
+
+@pytest.fixture
+def library():
+    library = Windows()
+    library._pywinauto_module = mock.Mock()
+    library._pywinauto_module.uia_element_info.UIAElementInfo = FakeUIAElementInfo
+    library.windowtitle = "Calculator"
+    library.dlg = FakeDialog(
+        [
+            fake_control("One", "num1Button", rectangle=(0, 0, 10, 10)),
+            fake_control("Two", "num2Button", rectangle=(10, 0, 20, 10)),
+            fake_control("Clear entry", "Clear"),
+            fake_control("Clear", "clearButton"),
+            fake_control("Display is 0", "CalculatorResults", "TextBlock"),
+        ]
+    )
+    return library
+
+
+@pytest.mark.parametrize(
+    "locator,expected",
+    [
+        ("name:One", ("name", "One")),
+        ("class:Button", ("class_name", "Button")),
+        ("class_name:Button", ("class_name", "Button")),
+        ("type:Button", ("control_type", "Button")),
+        ("id:num1Button", ("automation_id", "num1Button")),
+        ("partial name:Display", ("partial name", "Display")),
+        ("regexp:^Clear", ("regexp", "^Clear")),
+        ("name:a:b", ("name", "a:b")),
+        ("One", ("any", "One")),
+        ("unknown:One", ("any", "unknown:One")),
+    ],
+)
+def test_determine_search_criteria(library, locator, expected):
+    assert library._determine_search_criteria(locator) == expected
+
+
+def test_find_element_by_indexed_criteria(library):
+    elements, _ = library.find_element("id:num2Button")
+
+    assert len(elements) == 1
+    assert elements[0]["name"] == "Two"
+    assert elements[0]["control"] is library.dlg.controls[1]
+
+
+def test_find_element_any_matches_all_indexed_criteria_in_order(library):
+    elements, locators = library.find_element("Clear")
+
+    assert [element["name"] for element in elements] == ["Clear entry", "Clear"]
+    assert sorted(locators) == sorted(
+        ["Calculator", "One", "Two", "Clear entry", "Clear", "Display is 0"]
+    )
+
+
+def test_find_element_first_only(library):
+    elements, _ = library.find_element("class:Button", first_only=True)
+    assert [element["name"] for element in elements] == ["One"]
+
+    elements, _ = library.find_element("partial name:Clear", first_only=True)
+    assert [element["name"] for element in elements] == ["Clear entry"]
+
+
+def test_find_element_matches_text_of_native_values(library):
+    elements, _ = library.find_element("12", "process_id")
+
+    assert len(elements) == 6
+    assert library.is_element_matching(elements[0], "1", "process_id", wildcard=True)
+
+
+def test_element_cache_is_reused_within_ttl(library):
+    library.find_element("One")
+    library.find_element("Two")
+
+    assert library.dlg.reads == 1
+
+
+def test_element_cache_is_disabled_with_zero_ttl(library):
+    library.element_cache_ttl = 0
+    library.find_element("One")
+    library.find_element("Two")
+
+    assert library.dlg.reads == 2
+
+
+def test_element_cache_is_cleared_on_actions(library):
+    library._add_app_instance(params={"windowtitle": "Calculator"})
+    library.find_element("One")
+    library.click_type(5, 5)
+    library.find_element("One")
+    library.restore_dialog()
+    library.find_element("One")
+
+    assert library.dlg.reads == 3
+
+
+def test_get_window_elements_returns_copies(library):
+    controls, elements = library.get_window_elements()
+    controls.clear()
+    elements[1]["name"] = "Changed"
+
+    elements, _ = library.find_element("name:One")
+    assert elements[0]["name"] == "One"
+    assert library.dlg.reads == 1
+
+
+def test_cached_uia_text_attributes_are_strings(library):
+    element_info = FakeUIAElementInfo()
+    element_info.element = mock.Mock()
+    element_info.element.BuildUpdatedCache.return_value = SimpleNamespace(
+        CachedAutomationId="",
+        CachedClassName="Button",
+        CachedControlType=99999,
+        CachedIsEnabled=1,
+        CachedNativeWindowHandle=0,
+        CachedName=None,
+        CachedProcessId=12,
+        CachedBoundingRectangle=FakeRect(0, 0, 10, 10),
+        CachedIsOffscreen=0,
+    )
+    iuia = library._pywinauto_module.uia_defines.IUIA.return_value
+    iuia.known_control_type_ids = {}
+
+    element = library._parse_element_attributes(
+        SimpleNamespace(element_info=element_info)
+    )
+
+    assert element["control_type"] == "None"
+    assert element["name"] == "None"
+    assert element["process_id"] == 12
+    assert element["rectangle"] == (0, 0, 10, 10)
+    assert not library.is_element_matching(element, "^Win", "regexp")
+
+
+def test_mouse_click_many_clicks_element_centers(library):
+    library.mouse_click_many(["One", "Two"], off_x=1)
+
+    mouse = library._pywinauto_module.mouse
+    assert mouse.click.call_args_list == [
+        mock.call(coords=(6, 5)),
+        mock.call(coords=(16, 5)),
+    ]
+
+
+def test_mouse_click_many_resolves_all_locators_before_clicking(library):
+    with pytest.raises(ValueError):
+        library.mouse_click_many(["One", "Missing"])
+
+    library._pywinauto_module.mouse.click.assert_not_called()
+
+
+def test_open_dialog_uses_cached_dialog_for_title(library):
+    notepad = FakeDialog([])
+    app_id = library._add_app_instance(params={"windowtitle": "Notepad"})
+    library._apps[app_id].update(dlg=notepad, dlg_title="Notepad")
+
+    assert library.open_dialog("Notepad") == app_id
+    assert library.dlg is notepad
+    assert library.windowtitle == "Notepad"
+
+
+def test_write_element_info_as_json(tmp_path):
+    elements = [{"name": "One", "rectangle": (0, 0, 10, 10)}, {"name": "Two"}]
+    write_element_info_as_json(elements, "elements", path=str(tmp_path))
+
+    content = json.loads((tmp_path / "elements.json").read_text())
+    assert content == [{"name": "One", "rectangle": [0, 0, 10, 10]}, {"name": "Two"}]
+
+
+def test_write_element_info_as_jsonl(tmp_path):
+    elements = [{"name": "One"}, {"name": "Two"}]
+    write_element_info_as_jsonl(elements, "elements", path=str(tmp_path))
+
+    lines = (tmp_path / "elements.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == elements
+
+
+def test_get_window_elements_writes_one_file_per_format(library, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _, elements = library.get_window_elements(element_json=True, element_jsonl=True)
+
+    output = tmp_path / "output" / "json"
+    assert len(json.loads(next(output.glob("*.json")).read_text())) == len(elements)
+    assert len(next(output.glob("*.jsonl")).read_text().splitlines()) == len(elements)